@@ -1,10 +1,10 @@
 from __future__ import annotations
 from dataclasses import dataclass, field
-from typing import List, Dict, Tuple, Optional
+import math
+from typing import List, Dict, NamedTuple, Optional
 
 from .models import (
     Dimension3D,
-    Tolerance,
     InventoryItem,
     PartRequirement,
     CuttingParameters,
@@ -21,7 +21,7 @@ PART_COLOR_MAP = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class LengthSegmentPlan:
     start_mm: float
     end_mm: float
@@ -29,7 +29,7 @@ class LengthSegmentPlan:
     offcuts: List[Offcut] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class StickPlan:
     inventory_name: str
     stick_index: int
@@ -46,14 +46,59 @@ class OptimizationResult:
     summary_by_part: Dict[str, Dict[str, float]]
 
 
-def _fits(required: Dimension3D, available: Dimension3D, tol: Tolerance) -> bool:
-    return tol.within(required, available)
+class _Orientation(NamedTuple):
+    length_mm: float
+    dims: Dimension3D
+    strip: Optional[Dimension3D]  # width offcut left beside the piece, if kept
+    volume: float
+
+
+class _ItemCandidate(NamedTuple):
+    part: PartRequirement
+    slot: int
+    color: str
+    orientations: List[_Orientation]
+    shortest_mm: float
 
 
 def _choose_color(part: PartRequirement) -> str:
     return PART_COLOR_MAP.get(part.name.lower(), "#607D8B")
 
 
+def _candidate_dims(part: PartRequirement) -> List[Dimension3D]:
+    # Respect grain along length: default alignment along stock length
+    req = part.required_dimensions_mm
+    part_len = req.length_mm
+    part_w = req.width_mm
+    part_t = req.thickness_mm
+
+    # Consider simple rotations subject to grain and flags
+    dims = [Dimension3D(part_len, part_w, part_t)]
+    if part.allow_rotation_width_thickness:
+        dims.append(Dimension3D(part_len, part_t, part_w))
+    if not part.enforce_grain_along_length:
+        if part.allow_rotation_length_width:
+            dims.append(Dimension3D(part_w, part_len, part_t))
+        if part.allow_rotation_length_thickness:
+            dims.append(Dimension3D(part_t, part_w, part_len))
+    # deduplicate
+    unique: List[Dimension3D] = []
+    seen = set()
+    for d in dims:
+        tup = (d.length_mm, d.width_mm, d.thickness_mm)
+        if tup not in seen:
+            unique.append(d)
+            seen.add(tup)
+    return unique
+
+
+def _part_order_key(params: CuttingParameters):
+    if params.optimization_priority == "speed":
+        # First-fit decreasing: longest parts first within each priority level
+        return lambda p: (-p.priority, -p.required_dimensions_mm.length_mm, p.name)
+    return lambda p: (-p.priority, p.name)
+
+
 def optimize_cutting_plan(
     inventory: List[InventoryItem],
     required_parts: List[PartRequirement],
@@ -61,8 +106,24 @@ def optimize_cutting_plan(
 ) -> OptimizationResult:
     # Simple greedy heuristic along length, then pack width, then thickness
     # Tracks kerf and offcuts; allows tolerance-based acceptance
-    required_left: Dict[str, int] = {p.key: p.quantity_total for p in required_parts}
+    # Remaining quantity per part key, indexed by slot
+    slot_by_key = {key: i for i, key in enumerate(dict.fromkeys(p.key for p in required_parts))}
+    required_left: List[int] = [0] * len(slot_by_key)
+    for p in required_parts:
+        required_left[slot_by_key[p.key]] = p.quantity_total
+    # Pieces still needed across all parts
+    pieces_left = sum(qty for qty in required_left if qty > 0)
     part_by_key = {p.key: p for p in required_parts}
+    order_key = _part_order_key(params)
+    # Parts in placement order with their slot, color and orientations
+    part_candidates = [
+        (p, slot_by_key[p.key], _choose_color(p), _candidate_dims(p))
+        for p in sorted(required_parts, key=order_key)
+    ]
+    tol = params.tolerance
+    tol_l, tol_w, tol_t = tol.length_mm, tol.width_mm, tol.thickness_mm
+    kerf = params.kerf_mm
+    min_keep = params.min_offcut_keep_mm
 
     stick_plans: List[StickPlan] = []
 
@@ -71,62 +132,70 @@ def optimize_cutting_plan(
     total_cuts = 0
 
     for item in inventory:
+        stock = item.dimensions_mm
+        L = stock.length_mm
+        stock_w = stock.width_mm
+        stock_t = stock.thickness_mm
+        stock_volume = L * stock_w * stock_t
+
+        # Orientations whose cross-section fits this stock item
+        item_candidates: List[_ItemCandidate] = []
+        for part, slot, color, candidates in part_candidates:
+            fitting = []
+            for c in candidates:
+                # Same test as Tolerance.within
+                if not (
+                    L >= c.length_mm - tol_l
+                    and stock_w >= c.width_mm - tol_w
+                    and stock_t >= c.thickness_mm - tol_t
+                ):
+                    continue
+                width_offcut = stock_w - c.width_mm
+                strip = (
+                    Dimension3D(c.length_mm, width_offcut - kerf, c.thickness_mm)
+                    if width_offcut >= min_keep
+                    else None
+                )
+                fitting.append(_Orientation(c.length_mm, c, strip, c.length_mm * c.width_mm * c.thickness_mm))
+            if fitting:
+                shortest_mm = min(o.length_mm for o in fitting)
+                item_candidates.append(_ItemCandidate(part, slot, color, fitting, shortest_mm))
+
         for i in range(item.quantity):
             stick = StickPlan(
                 inventory_name=item.name,
                 stick_index=i + 1,
-                dims_mm=item.dimensions_mm,
+                dims_mm=stock,
                 segments=[],
             )
 
+            # Parts still worth trying on this stick, in placement order
+            active = [pc for pc in item_candidates if required_left[pc.slot] > 0]
+            # Shortest piece any active part could yield
+            shortest = min((pc.shortest_mm for pc in active), default=math.inf)
             length_cursor = 0.0
-            L = item.dimensions_mm.length_mm
             while length_cursor < L:
-                remaining_length = L - length_cursor
+                reach = (L - length_cursor) + kerf
                 segment = LengthSegmentPlan(start_mm=length_cursor, end_mm=L)
 
                 # Try to place parts that fit in remaining length
+                if reach < shortest:
+                    # No remaining candidate fits what is left of this stick
+                    active.clear()
                 placed_any = False
-                for part in sorted(required_parts, key=lambda p: (-p.priority, p.name)):
-                    qty_left = required_left.get(part.key, 0)
+                for idx, (part, slot, color, orientations, _) in enumerate(active):
+                    qty_left = required_left[slot]
                     if qty_left <= 0:
                         continue
 
-                    req = part.required_dimensions_mm
-                    # Respect grain along length: default alignment along stock length
-                    part_len = req.length_mm
-                    part_w = req.width_mm
-                    part_t = req.thickness_mm
-
-                    # Consider simple rotations subject to grain and flags
-                    def candidate_dims() -> List[Dimension3D]:
-                        dims = [Dimension3D(part_len, part_w, part_t)]
-                        if part.allow_rotation_width_thickness:
-                            dims.append(Dimension3D(part_len, part_t, part_w))
-                        if not part.enforce_grain_along_length:
-                            if part.allow_rotation_length_width:
-                                dims.append(Dimension3D(part_w, part_len, part_t))
-                            if part.allow_rotation_length_thickness:
-                                dims.append(Dimension3D(part_t, part_w, part_len))
-                        # deduplicate
-                        unique: List[Dimension3D] = []
-                        seen = set()
-                        for d in dims:
-                            tup = (d.length_mm, d.width_mm, d.thickness_mm)
-                            if tup not in seen:
-                                unique.append(d)
-                                seen.add(tup)
-                        return unique
-
-                    picked_dims: Optional[Dimension3D] = None
-                    for cand in candidate_dims():
-                        if remaining_length + params.kerf_mm < cand.length_mm:
-                            continue
-                        if _fits(cand, item.dimensions_mm, params.tolerance):
-                            picked_dims = cand
+                    picked: Optional[_Orientation] = None
+                    for orientation in orientations:
+                        if reach >= orientation.length_mm:
+                            picked = orientation
                             break
-                    if picked_dims is None:
+                    if picked is None:
                         continue
+                    cut_len, picked_dims, strip_dims, cut_volume = picked
 
                     # Place one piece at current cursor
                     piece_pos = (length_cursor, 0.0, 0.0)
@@ -134,28 +203,27 @@ def optimize_cutting_plan(
                         part_key=part.key,
                         dims_mm=picked_dims,
                         position_mm=piece_pos,
-                        color=_choose_color(part),
+                        color=color,
                     )
                     segment.cuts.append(cut_piece)
-                    length_cursor += picked_dims.length_mm + params.kerf_mm
-                    total_cut_volume += (
-                        picked_dims.length_mm * picked_dims.width_mm * picked_dims.thickness_mm
-                    )
-                    required_left[part.key] = qty_left - 1
+                    length_cursor += cut_len + kerf
+                    total_cut_volume += cut_volume
+                    required_left[slot] = qty_left - 1
+                    pieces_left -= 1
                     total_cuts += 1
                     placed_any = True
+                    # Every part scanned before this one is exhausted or longer
+                    # than the remaining length, which only shrinks on this stick
+                    if idx:
+                        del active[:idx]
+                        shortest = min(pc.shortest_mm for pc in active)
 
                     # If width leftover beyond keep threshold, track an offcut strip
-                    width_offcut = item.dimensions_mm.width_mm - picked_dims.width_mm
-                    if width_offcut >= params.min_offcut_keep_mm:
+                    if strip_dims is not None:
                         segment.offcuts.append(
                             Offcut(
-                                dims_mm=Dimension3D(
-                                    length_mm=picked_dims.length_mm,
-                                    width_mm=width_offcut - params.kerf_mm,
-                                    thickness_mm=picked_dims.thickness_mm,
-                                ),
-                                position_mm=(piece_pos[0], picked_dims.width_mm + params.kerf_mm, 0.0),
+                                dims_mm=strip_dims,
+                                position_mm=(piece_pos[0], picked_dims.width_mm + kerf, 0.0),
                             )
                         )
 
@@ -164,13 +232,13 @@ def optimize_cutting_plan(
                 if not placed_any:
                     # If nothing fits, create an offcut for the rest if large enough and end segment
                     leftover_len = L - length_cursor
-                    if leftover_len >= params.min_offcut_keep_mm:
+                    if leftover_len >= min_keep:
                         segment.offcuts.append(
                             Offcut(
                                 dims_mm=Dimension3D(
                                     length_mm=leftover_len,
-                                    width_mm=item.dimensions_mm.width_mm,
-                                    thickness_mm=item.dimensions_mm.thickness_mm,
+                                    width_mm=stock_w,
+                                    thickness_mm=stock_t,
                                 ),
                                 position_mm=(length_cursor, 0.0, 0.0),
                             )
@@ -185,17 +253,13 @@ def optimize_cutting_plan(
                     stick.segments.append(segment)
 
                 # Stop if nothing left to cut
-                if all(qty <= 0 for qty in required_left.values()):
+                if pieces_left == 0:
                     break
 
             stick_plans.append(stick)
-            total_stock_volume += (
-                item.dimensions_mm.length_mm
-                * item.dimensions_mm.width_mm
-                * item.dimensions_mm.thickness_mm
-            )
+            total_stock_volume += stock_volume
 
-        if all(qty <= 0 for qty in required_left.values()):
+        if pieces_left == 0:
             break
 
     utilization_percent = (
@@ -206,7 +270,7 @@ def optimize_cutting_plan(
     # Summary by part
     summary_by_part: Dict[str, Dict[str, float]] = {}
     for key, part in part_by_key.items():
-        produced = part.quantity_total - required_left.get(key, 0)
+        produced = part.quantity_total - required_left[slot_by_key[key]]
         summary_by_part[key] = {
             "produced": float(produced),
             "requested": float(part.quantity_total),
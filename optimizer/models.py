@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Dimension3D:
     length_mm: float
     width_mm: float
@@ -13,7 +13,7 @@ class Dimension3D:
         return (self.length_mm, self.width_mm, self.thickness_mm)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tolerance:
     length_mm: float = 0.0
     width_mm: float = 0.0
@@ -27,7 +27,7 @@ class Tolerance:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class InventoryItem:
     name: str
     dimensions_mm: Dimension3D
@@ -36,7 +36,7 @@ class InventoryItem:
     material: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PartRequirement:
     key: str
     name: str
@@ -50,7 +50,7 @@ class PartRequirement:
     priority: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CuttingParameters:
     kerf_mm: float
     min_offcut_keep_mm: float = 0.0
@@ -58,7 +58,7 @@ class CuttingParameters:
     optimization_priority: str = "efficiency"  # efficiency | cost | speed
 
 
-@dataclass
+@dataclass(slots=True)
 class CutPiece:
     part_key: str
     dims_mm: Dimension3D
@@ -66,7 +66,7 @@ class CutPiece:
     color: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Offcut:
     dims_mm: Dimension3D
     position_mm: Tuple[float, float, float]
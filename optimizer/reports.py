@@ -1,13 +1,9 @@
 from __future__ import annotations
 from dataclasses import asdict
-from typing import List, Dict
+from typing import BinaryIO, List, Dict
 import io
 import csv
 
-from reportlab.lib.pagesizes import A4
-from reportlab.pdfgen import canvas
-from reportlab.lib.units import mm
-
 from .guillotine import OptimizationResult
 from .svg import render_stick_svg
 
@@ -16,22 +12,30 @@ def export_csv(result: OptimizationResult) -> str:
     output = io.StringIO()
     writer = csv.writer(output)
 
-    writer.writerow(["metric", "value"])
-    writer.writerow(["utilization_percent", f"{result.utilization_percent:.2f}"])
-    writer.writerow(["waste_percent", f"{result.waste_percent:.2f}"])
-    writer.writerow(["total_cuts", result.total_cuts])
-
-    writer.writerow([])
-    writer.writerow(["part_key", "produced", "requested"])
-    for k, v in result.summary_by_part.items():
-        writer.writerow([k, v.get("produced", 0), v.get("requested", 0)])
+    writer.writerows(
+        (
+            ("metric", "value"),
+            ("utilization_percent", f"{result.utilization_percent:.2f}"),
+            ("waste_percent", f"{result.waste_percent:.2f}"),
+            ("total_cuts", result.total_cuts),
+            (),
+            ("part_key", "produced", "requested"),
+        )
+    )
+    writer.writerows(
+        (k, v.get("produced", 0), v.get("requested", 0)) for k, v in result.summary_by_part.items()
+    )
 
     return output.getvalue()
 
 
-def export_pdf(result: OptimizationResult) -> bytes:
-    buffer = io.BytesIO()
-    c = canvas.Canvas(buffer, pagesize=A4)
+def write_pdf(result: OptimizationResult, fp: BinaryIO) -> None:
+    # reportlab is imported on first use so CSV export does not need it
+    from reportlab.lib.pagesizes import A4
+    from reportlab.pdfgen import canvas
+    from reportlab.lib.units import mm
+
+    c = canvas.Canvas(fp, pagesize=A4)
     width, height = A4
 
     # Title
@@ -73,4 +77,9 @@ def export_pdf(result: OptimizationResult) -> bytes:
         y -= 3 * mm
 
     c.save()
+
+
+def export_pdf(result: OptimizationResult) -> bytes:
+    buffer = io.BytesIO()
+    write_pdf(result, buffer)
     return buffer.getvalue()
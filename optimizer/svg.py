@@ -1,59 +1,92 @@
 from __future__ import annotations
-from typing import List
+import io
+from typing import Dict, List, TextIO
 
 from .guillotine import StickPlan
 
 
-def render_stick_svg(stick: StickPlan, px_per_mm: float = 0.5) -> str:
-    L = stick.dims_mm.length_mm * px_per_mm
-    W = stick.dims_mm.width_mm * px_per_mm
+# Markup templates, filled with %
+_EMPTY_COMPOSITE = "<svg xmlns='http://www.w3.org/2000/svg' width='100' height='40'></svg>"
+_STICK_OPEN = '<svg xmlns="http://www.w3.org/2000/svg" width="%s" height="%s" viewBox="0 0 %s %s">\n'
+_COMPOSITE_OPEN = '<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d">\n'
+_STICK_FRAME = (
+    '<rect x="0" y="0" width="%s" height="%s" fill="#f5f5f5" stroke="#999"/>\n'
+    '<text x="5" y="15" font-size="12" fill="#333">%s #%s</text>\n'
+)
+_PIECE_RECT = '<rect x="%s" y="%s" width="%s" height="%s"/>\n'
+_PIECE_LABEL = '<text x="%s" y="%s">%s</text>\n'
+
+
+def _fmt(value: float) -> str:
+    # Two decimals, trailing zeros dropped: 300.0 -> "300", 501.599 -> "501.6"
+    return f"{value:.2f}".rstrip("0").rstrip(".")
+
+
+def _write_stick_body(out: TextIO, stick: StickPlan, px_per_mm: float) -> None:
+    # Everything inside the stick's frame, shared by the single and composite views
+    L = _fmt(stick.dims_mm.length_mm * px_per_mm)
+    W = _fmt(stick.dims_mm.width_mm * px_per_mm)
 
-    svg_parts = [
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{L}" height="{W}" viewBox="0 0 {L} {W}">',
-        f'<rect x="0" y="0" width="{L}" height="{W}" fill="#f5f5f5" stroke="#999"/>',
-        f'<text x="5" y="15" font-size="12" fill="#333">{stick.inventory_name} #{stick.stick_index}</text>',
-    ]
+    write = out.write
+    write(_STICK_FRAME % (L, W, stick.inventory_name, stick.stick_index))
 
+    # Pieces are grouped by color so shared attributes are written once per group
+    rects_by_color: Dict[str, List[str]] = {}
+    labels: List[str] = []
     for seg in stick.segments:
         for cut in seg.cuts:
-            x = cut.position_mm[0] * px_per_mm
-            y = cut.position_mm[1] * px_per_mm
-            w = cut.dims_mm.length_mm * px_per_mm
-            h = cut.dims_mm.width_mm * px_per_mm
-            svg_parts.append(
-                f'<rect x="{x}" y="{y}" width="{w}" height="{h}" fill="{cut.color}" opacity="0.8" stroke="#222"/>'
-            )
-            svg_parts.append(
-                f'<text x="{x + 2}" y="{y + 12}" font-size="10" fill="#000">{cut.part_key}</text>'
+            pos = cut.position_mm
+            dims = cut.dims_mm
+            x = pos[0] * px_per_mm
+            y = pos[1] * px_per_mm
+            rects_by_color.setdefault(cut.color, []).append(
+                _PIECE_RECT % (_fmt(x), _fmt(y), _fmt(dims.length_mm * px_per_mm), _fmt(dims.width_mm * px_per_mm))
             )
+            labels.append(_PIECE_LABEL % (_fmt(x + 2), _fmt(y + 12), cut.part_key))
+
+    if not labels:
+        return
+    write('<g opacity="0.8" stroke="#222">\n')
+    for color, rects in rects_by_color.items():
+        write(f'<g fill="{color}">\n')
+        write("".join(rects))
+        write("</g>\n")
+    write('</g>\n<g font-size="10" fill="#000">\n')
+    write("".join(labels))
+    write("</g>\n")
+
+
+def render_stick_svg(stick: StickPlan, px_per_mm: float = 0.5) -> str:
+    L = _fmt(stick.dims_mm.length_mm * px_per_mm)
+    W = _fmt(stick.dims_mm.width_mm * px_per_mm)
 
-    svg_parts.append("</svg>")
-    return "\n".join(svg_parts)
+    out = io.StringIO()
+    out.write(_STICK_OPEN % (L, W, L, W))
+    _write_stick_body(out, stick, px_per_mm)
+    out.write("</svg>")
+    return out.getvalue()
 
 
 def render_composite_svg(sticks: List[StickPlan], px_per_mm: float = 0.3, gap_px: int = 20) -> str:
     if not sticks:
-        return "<svg xmlns='http://www.w3.org/2000/svg' width='100' height='40'></svg>"
+        return _EMPTY_COMPOSITE
 
+    # Sticks are drawn length along x and stacked by width, with a 20px margin
+    lengths = [s.dims_mm.length_mm * px_per_mm for s in sticks]
     widths = [s.dims_mm.width_mm * px_per_mm for s in sticks]
-    heights = [s.dims_mm.length_mm * px_per_mm for s in sticks]
 
-    total_w = int(max(widths) + 40)
-    total_h = int(sum(heights) + gap_px * (len(sticks) - 1) + 40)
+    total_w = int(max(lengths) + 40)
+    total_h = int(sum(widths) + gap_px * (len(sticks) - 1) + 40)
 
     y_cursor = 20
-    svg_parts = [
-        f'<svg xmlns="http://www.w3.org/2000/svg" width="{total_w}" height="{total_h}">'
-    ]
+    out = io.StringIO()
+    out.write(_COMPOSITE_OPEN % (total_w, total_h))
 
     for stick in sticks:
-        # rotate to show length along x for consistency
-        sub = render_stick_svg(stick, px_per_mm)
-        # embed using foreignObject is complex; simplest is concatenate with translate
-        svg_parts.append(f'<g transform="translate(20,{y_cursor})">')
-        svg_parts.append(sub.replace("<svg", "<g").replace("</svg>", "</g>"))
-        svg_parts.append("</g>")
+        out.write(f'<g transform="translate(20,{_fmt(y_cursor)})">\n')
+        _write_stick_body(out, stick, px_per_mm)
+        out.write("</g>\n")
         y_cursor += stick.dims_mm.width_mm * px_per_mm + gap_px
 
-    svg_parts.append("</svg>")
-    return "\n".join(svg_parts)
+    out.write("</svg>")
+    return out.getvalue()
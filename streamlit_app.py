@@ -1,7 +1,15 @@
+import hashlib
 import io
-from typing import List, Dict
-
+import pickle
+import re
+import shelve
+import threading
+from pathlib import Path
+from typing import List, Dict, Optional
+
+import pandas as pd
 import streamlit as st
+import streamlit.components.v1 as components
 
 from optimizer.io import (
     load_inventory_filelike,
@@ -10,7 +18,7 @@ from optimizer.io import (
     load_parts_csv,
     default_parameters,
 )
-from optimizer.models import InventoryItem, PartRequirement, Dimension3D, CuttingParameters
+from optimizer.models import InventoryItem, PartRequirement, Dimension3D, CuttingParameters, Tolerance
 from optimizer.guillotine import optimize_cutting_plan, OptimizationResult
 from optimizer.svg import render_stick_svg, render_composite_svg
 from optimizer.reports import export_csv, export_pdf
@@ -23,8 +31,32 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
+STATE_DIR = Path(".streamlit_state")
+PERSISTED_KEYS = ("inventory_rows", "part_rows", "parameters", "result")
+MAX_STICK_OPTIONS = 200
+STICK_PAGE_SIZE = 50
+# st.cache_data is shared by every session, so each cache keeps only recent entries
+CACHE_ENTRIES = 32
+STICK_SVG_CACHE_ENTRIES = 256
+
+METRIC_CELL = (
+    '<div style="flex:1"><div style="font-size:0.875rem;opacity:0.7">{label}</div>'
+    '<div style="font-size:2.25rem">{value}</div></div>'
+)
+
+SVG_COMMENT = re.compile(r"<!--.*?-->", re.S)
+SVG_INTER_TAG_SPACE = re.compile(r">\s+<")
+SVG_TAG = re.compile(r"<[^>]+>")
+SVG_TRAILING_ZEROS = re.compile(r"(\d)\.0+(?=[\s\"])")
+SVG_DEFAULT_XY = re.compile(r'\s[xy]="0"')
+
 
 def init_state() -> None:
+    if "project" not in st.session_state:
+        # The project name lives in the URL so a browser reload restores it
+        st.session_state.project = st.query_params.get("project", "")
+    if "inventory_rows" not in st.session_state:
+        load_saved_state()
     if "inventory_rows" not in st.session_state:
         st.session_state.inventory_rows = []  # list[dict]
     if "part_rows" not in st.session_state:
@@ -33,23 +65,120 @@ def init_state() -> None:
         st.session_state.parameters = default_parameters()
     if "result" not in st.session_state:
         st.session_state.result = None
+    if "result_key" not in st.session_state:
+        st.session_state.result_key = None
+    if "inventory_df" not in st.session_state:
+        st.session_state.inventory_df = pd.DataFrame(st.session_state.inventory_rows)
+    if "part_df" not in st.session_state:
+        st.session_state.part_df = pd.DataFrame(st.session_state.part_rows)
+
+
+def set_rows(table: str, rows: List[Dict]) -> None:
+    # Each table keeps its display DataFrame next to its rows
+    st.session_state[f"{table}_rows"] = rows
+    st.session_state[f"{table}_df"] = pd.DataFrame(rows)
+
+
+def append_row(table: str, row: Dict) -> None:
+    st.session_state[f"{table}_rows"].append(row)
+    df = st.session_state[f"{table}_df"]
+    new = pd.DataFrame([row])
+    st.session_state[f"{table}_df"] = new if df.empty else pd.concat([df, new], ignore_index=True)
+
+
+def state_db_path() -> str:
+    STATE_DIR.mkdir(exist_ok=True)
+    return str(STATE_DIR / "sessions")
+
+
+@st.cache_resource
+def state_lock() -> threading.Lock:
+    # Sessions are threads of one server process; shelve needs writers serialized
+    return threading.Lock()
+
+
+def current_project() -> str:
+    # Unnamed sessions are never persisted, so visitors don't share a snapshot
+    return st.session_state.get("project", "").strip()
+
+
+def read_snapshot(project: str) -> Optional[Dict]:
+    with state_lock(), shelve.open(state_db_path()) as db:
+        saved = db.get(project)
+    return None if saved is None else {k: saved[k] for k in PERSISTED_KEYS}
+
+
+def apply_snapshot(state: Dict) -> None:
+    st.session_state.update(state)
+    set_rows("inventory", state["inventory_rows"])
+    set_rows("part", state["part_rows"])
+    # result_key is not persisted; derive it from the restored result
+    st.session_state.result_key = result_key(state["result"]) if state["result"] is not None else None
+
+
+def load_saved_state() -> Optional[bool]:
+    # True if the project's snapshot was restored, False if it has none, None if
+    # it could not be read; only a restored snapshot touches the session
+    project = current_project()
+    if not project:
+        return False
+    try:
+        state = read_snapshot(project)
+    except Exception as e:
+        st.warning(f"Could not restore saved state for project '{project}': {e}")
+        return None
+    if state is None:
+        return False
+    apply_snapshot(state)
+    return True
+
+
+def switch_project() -> None:
+    project = current_project()
+    if project:
+        st.query_params["project"] = project
+    else:
+        st.query_params.pop("project", None)
+    # A new project name adopts the work already in the session
+    if load_saved_state() is False:
+        save_state()
+
+
+def save_state() -> bool:
+    project = current_project()
+    if not project:
+        return False
+    with state_lock(), shelve.open(state_db_path()) as db:
+        db[project] = {k: st.session_state[k] for k in PERSISTED_KEYS}
+    return True
+
+
+def as_float(value) -> float:
+    return 0.0 if value in (None, "") else float(value)
+
+
+def as_int(value) -> int:
+    return 0 if value in (None, "") else int(value)
 
 
 def to_inventory_items(rows: List[Dict]) -> List[InventoryItem]:
     items: List[InventoryItem] = []
+    append = items.append
     for r in rows:
+        get = r.get
         try:
-            items.append(
+            cost = get("cost_per_unit")
+            append(
                 InventoryItem(
-                    name=str(r.get("name", "")),
+                    name=str(get("name", "")),
                     dimensions_mm=Dimension3D(
-                        length_mm=float(r.get("length_mm", 0) or 0),
-                        width_mm=float(r.get("width_mm", 0) or 0),
-                        thickness_mm=float(r.get("thickness_mm", 0) or 0),
+                        length_mm=as_float(get("length_mm")),
+                        width_mm=as_float(get("width_mm")),
+                        thickness_mm=as_float(get("thickness_mm")),
                     ),
-                    quantity=int(r.get("quantity", 0) or 0),
-                    cost_per_unit=float(r.get("cost_per_unit")) if r.get("cost_per_unit") not in (None, "") else None,
-                    material=(r.get("material") or None),
+                    quantity=as_int(get("quantity")),
+                    cost_per_unit=None if cost in (None, "") else float(cost),
+                    material=(get("material") or None),
                 )
             )
         except Exception:
@@ -59,24 +188,26 @@ def to_inventory_items(rows: List[Dict]) -> List[InventoryItem]:
 
 def to_part_requirements(rows: List[Dict]) -> List[PartRequirement]:
     parts: List[PartRequirement] = []
+    append = parts.append
     for r in rows:
+        get = r.get
         try:
-            parts.append(
+            append(
                 PartRequirement(
-                    key=str(r.get("key", "")),
-                    name=str(r.get("name", "")),
-                    material=str(r.get("material", "")),
+                    key=str(get("key", "")),
+                    name=str(get("name", "")),
+                    material=str(get("material", "")),
                     required_dimensions_mm=Dimension3D(
-                        length_mm=float(r.get("length_mm", 0) or 0),
-                        width_mm=float(r.get("width_mm", 0) or 0),
-                        thickness_mm=float(r.get("thickness_mm", 0) or 0),
+                        length_mm=as_float(get("length_mm")),
+                        width_mm=as_float(get("width_mm")),
+                        thickness_mm=as_float(get("thickness_mm")),
                     ),
-                    quantity_total=int(r.get("quantity_total", 0) or 0),
-                    allow_rotation_length_width=bool(r.get("allow_rotation_length_width", False)),
-                    allow_rotation_width_thickness=bool(r.get("allow_rotation_width_thickness", False)),
-                    allow_rotation_length_thickness=bool(r.get("allow_rotation_length_thickness", False)),
-                    enforce_grain_along_length=bool(r.get("enforce_grain_along_length", True)),
-                    priority=int(r.get("priority", 0) or 0),
+                    quantity_total=as_int(get("quantity_total")),
+                    allow_rotation_length_width=bool(get("allow_rotation_length_width", False)),
+                    allow_rotation_width_thickness=bool(get("allow_rotation_width_thickness", False)),
+                    allow_rotation_length_thickness=bool(get("allow_rotation_length_thickness", False)),
+                    enforce_grain_along_length=bool(get("enforce_grain_along_length", True)),
+                    priority=as_int(get("priority")),
                 )
             )
         except Exception:
@@ -84,29 +215,126 @@ def to_part_requirements(rows: List[Dict]) -> List[PartRequirement]:
     return parts
 
 
+def inventory_row(it: InventoryItem) -> Dict:
+    return {
+        "name": it.name,
+        "length_mm": it.dimensions_mm.length_mm,
+        "width_mm": it.dimensions_mm.width_mm,
+        "thickness_mm": it.dimensions_mm.thickness_mm,
+        "quantity": it.quantity,
+        "cost_per_unit": it.cost_per_unit,
+        "material": it.material,
+    }
+
+
+def part_row(p: PartRequirement) -> Dict:
+    return {
+        "key": p.key,
+        "name": p.name,
+        "material": p.material,
+        "length_mm": p.required_dimensions_mm.length_mm,
+        "width_mm": p.required_dimensions_mm.width_mm,
+        "thickness_mm": p.required_dimensions_mm.thickness_mm,
+        "quantity_total": p.quantity_total,
+        "allow_rotation_length_width": p.allow_rotation_length_width,
+        "allow_rotation_width_thickness": p.allow_rotation_width_thickness,
+        "allow_rotation_length_thickness": p.allow_rotation_length_thickness,
+        "enforce_grain_along_length": p.enforce_grain_along_length,
+        "priority": p.priority,
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_ENTRIES)
+def parse_inventory_upload(raw: bytes) -> List[Dict]:
+    return [inventory_row(it) for it in load_inventory_filelike(io.StringIO(raw.decode("utf-8")))]
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_ENTRIES)
+def parse_parts_upload(raw: bytes) -> List[Dict]:
+    return [part_row(p) for p in load_parts_filelike(io.StringIO(raw.decode("utf-8")))]
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_ENTRIES)
+def cached_optimize(
+    inventory: List[InventoryItem], parts: List[PartRequirement], params: CuttingParameters
+) -> OptimizationResult:
+    return optimize_cutting_plan(inventory, parts, params)
+
+
+def result_key(result: OptimizationResult) -> str:
+    # Content hash of the whole result, used as the cache key for derived views
+    return hashlib.blake2b(pickle.dumps(result), digest_size=16).hexdigest()
+
+
+def metrics_html(result: OptimizationResult) -> str:
+    # Headline numbers as a single markdown block
+    cells = (
+        ("Utilization %", f"{result.utilization_percent:.2f}"),
+        ("Waste %", f"{result.waste_percent:.2f}"),
+        ("Total cuts", f"{result.total_cuts}"),
+    )
+    body = "".join(METRIC_CELL.format(label=label, value=value) for label, value in cells)
+    return f'<div style="display:flex;gap:1rem">{body}</div>'
+
+
+def minify_tag(match: re.Match) -> str:
+    return SVG_DEFAULT_XY.sub("", SVG_TRAILING_ZEROS.sub(r"\1", match.group()))
+
+
+def minify_svg(svg: str) -> str:
+    # Shrinks the payload sent to the browser; text content is left untouched
+    svg = SVG_COMMENT.sub("", svg)
+    svg = SVG_INTER_TAG_SPACE.sub("><", svg)
+    return SVG_TAG.sub(minify_tag, svg)
+
+
+@st.cache_data(show_spinner=False, max_entries=STICK_SVG_CACHE_ENTRIES)
+def cached_stick_svg(key: str, index: int, px_per_mm: float, _result: OptimizationResult) -> str:
+    return minify_svg(render_stick_svg(_result.stick_plans[index], px_per_mm=px_per_mm))
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_ENTRIES)
+def cached_composite_svg(key: str, px_per_mm: float, _result: OptimizationResult) -> str:
+    return minify_svg(render_composite_svg(_result.stick_plans, px_per_mm=px_per_mm))
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_ENTRIES)
+def cached_part_summary(key: str, _result: OptimizationResult) -> pd.DataFrame:
+    summaries = _result.summary_by_part.values()
+    df = pd.DataFrame(
+        {
+            "part_key": list(_result.summary_by_part),
+            "produced": [s.get("produced", 0) for s in summaries],
+            "requested": [s.get("requested", 0) for s in summaries],
+        }
+    )
+    return df.astype({"produced": "int32", "requested": "int32"})
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_ENTRIES)
+def cached_csv_export(key: str, _result: OptimizationResult) -> str:
+    return export_csv(_result)
+
+
+@st.cache_data(show_spinner=False, max_entries=CACHE_ENTRIES)
+def cached_pdf_export(key: str, _result: OptimizationResult) -> bytes:
+    return export_pdf(_result)
+
+
 def step_inputs() -> None:
     st.header("Step 1 — Input Inventory and Parts")
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Inventory")
         inv_upload = st.file_uploader("Upload inventory CSV", type=["csv"], key="inv_csv")
-        if inv_upload is not None:
+        if inv_upload is None:
+            st.session_state.pop("inv_csv_file_id", None)
+        elif st.session_state.get("inv_csv_file_id") != inv_upload.file_id:
+            # Each upload is applied once; re-uploading a file gives it a new file_id
             try:
-                rows = []
-                items = load_inventory_filelike(io.StringIO(inv_upload.getvalue().decode("utf-8")))
-                for it in items:
-                    rows.append(
-                        {
-                            "name": it.name,
-                            "length_mm": it.dimensions_mm.length_mm,
-                            "width_mm": it.dimensions_mm.width_mm,
-                            "thickness_mm": it.dimensions_mm.thickness_mm,
-                            "quantity": it.quantity,
-                            "cost_per_unit": it.cost_per_unit,
-                            "material": it.material,
-                        }
-                    )
-                st.session_state.inventory_rows = rows
+                set_rows("inventory", parse_inventory_upload(inv_upload.getvalue()))
+                st.session_state.inv_csv_file_id = inv_upload.file_id
+                save_state()
                 st.success("Inventory CSV loaded")
             except Exception as e:
                 st.error(f"Failed to parse inventory CSV: {e}")
@@ -114,28 +342,13 @@ def step_inputs() -> None:
     with col2:
         st.subheader("Parts")
         parts_upload = st.file_uploader("Upload parts CSV", type=["csv"], key="parts_csv")
-        if parts_upload is not None:
+        if parts_upload is None:
+            st.session_state.pop("parts_csv_file_id", None)
+        elif st.session_state.get("parts_csv_file_id") != parts_upload.file_id:
             try:
-                rows = []
-                parts = load_parts_filelike(io.StringIO(parts_upload.getvalue().decode("utf-8")))
-                for p in parts:
-                    rows.append(
-                        {
-                            "key": p.key,
-                            "name": p.name,
-                            "material": p.material,
-                            "length_mm": p.required_dimensions_mm.length_mm,
-                            "width_mm": p.required_dimensions_mm.width_mm,
-                            "thickness_mm": p.required_dimensions_mm.thickness_mm,
-                            "quantity_total": p.quantity_total,
-                            "allow_rotation_length_width": p.allow_rotation_length_width,
-                            "allow_rotation_width_thickness": p.allow_rotation_width_thickness,
-                            "allow_rotation_length_thickness": p.allow_rotation_length_thickness,
-                            "enforce_grain_along_length": p.enforce_grain_along_length,
-                            "priority": p.priority,
-                        }
-                    )
-                st.session_state.part_rows = rows
+                set_rows("part", parse_parts_upload(parts_upload.getvalue()))
+                st.session_state.parts_csv_file_id = parts_upload.file_id
+                save_state()
                 st.success("Parts CSV loaded")
             except Exception as e:
                 st.error(f"Failed to parse parts CSV: {e}")
@@ -146,36 +359,10 @@ def step_inputs() -> None:
         if st.button("Load Sample Data", use_container_width=True):
             try:
                 sample_inv = load_inventory_csv("sample_data/inventory.csv")
-                st.session_state.inventory_rows = [
-                    {
-                        "name": it.name,
-                        "length_mm": it.dimensions_mm.length_mm,
-                        "width_mm": it.dimensions_mm.width_mm,
-                        "thickness_mm": it.dimensions_mm.thickness_mm,
-                        "quantity": it.quantity,
-                        "cost_per_unit": it.cost_per_unit,
-                        "material": it.material,
-                    }
-                    for it in sample_inv
-                ]
+                set_rows("inventory", [inventory_row(it) for it in sample_inv])
                 sample_parts = load_parts_csv("sample_data/parts.csv")
-                st.session_state.part_rows = [
-                    {
-                        "key": p.key,
-                        "name": p.name,
-                        "material": p.material,
-                        "length_mm": p.required_dimensions_mm.length_mm,
-                        "width_mm": p.required_dimensions_mm.width_mm,
-                        "thickness_mm": p.required_dimensions_mm.thickness_mm,
-                        "quantity_total": p.quantity_total,
-                        "allow_rotation_length_width": p.allow_rotation_length_width,
-                        "allow_rotation_width_thickness": p.allow_rotation_width_thickness,
-                        "allow_rotation_length_thickness": p.allow_rotation_length_thickness,
-                        "enforce_grain_along_length": p.enforce_grain_along_length,
-                        "priority": p.priority,
-                    }
-                    for p in sample_parts
-                ]
+                set_rows("part", [part_row(p) for p in sample_parts])
+                save_state()
                 st.success("Loaded sample data")
             except Exception as e:
                 st.error(f"Failed to load sample data: {e}")
@@ -205,7 +392,8 @@ def step_inputs() -> None:
             submitted = st.form_submit_button("Add to tables")
             if submitted:
                 if inv_name:
-                    st.session_state.inventory_rows.append(
+                    append_row(
+                        "inventory",
                         {
                             "name": inv_name,
                             "length_mm": inv_L,
@@ -214,10 +402,11 @@ def step_inputs() -> None:
                             "quantity": int(inv_Q),
                             "cost_per_unit": float(inv_cost) if inv_cost else None,
                             "material": inv_mat or None,
-                        }
+                        },
                     )
                 if part_key:
-                    st.session_state.part_rows.append(
+                    append_row(
+                        "part",
                         {
                             "key": part_key,
                             "name": part_name,
@@ -231,14 +420,15 @@ def step_inputs() -> None:
                             "allow_rotation_length_thickness": False,
                             "enforce_grain_along_length": bool(part_grain),
                             "priority": int(part_priority),
-                        }
+                        },
                     )
+                save_state()
                 st.success("Added rows")
 
     st.subheader("Current Inventory")
-    st.dataframe(st.session_state.inventory_rows, use_container_width=True)
+    st.dataframe(st.session_state.inventory_df, use_container_width=True)
     st.subheader("Current Parts")
-    st.dataframe(st.session_state.part_rows, use_container_width=True)
+    st.dataframe(st.session_state.part_df, use_container_width=True)
 
 
 def step_parameters() -> None:
@@ -246,25 +436,36 @@ def step_parameters() -> None:
     params: CuttingParameters = st.session_state.parameters
     col1, col2, col3 = st.columns(3)
     with col1:
-        params.kerf_mm = st.number_input("Kerf (mm)", min_value=0.0, value=float(params.kerf_mm), step=0.1)
-        params.min_offcut_keep_mm = st.number_input(
+        kerf_mm = st.number_input("Kerf (mm)", min_value=0.0, value=float(params.kerf_mm), step=0.1)
+        min_offcut_keep_mm = st.number_input(
             "Minimum offcut to keep (mm)", min_value=0.0, value=float(params.min_offcut_keep_mm), step=1.0
         )
     with col2:
-        params.tolerance.length_mm = st.number_input(
-            "Tolerance length (mm)", min_value=0.0, value=float(params.tolerance.length_mm), step=0.5
-        )
-        params.tolerance.width_mm = st.number_input(
-            "Tolerance width (mm)", min_value=0.0, value=float(params.tolerance.width_mm), step=0.5
-        )
-        params.tolerance.thickness_mm = st.number_input(
-            "Tolerance thickness (mm)", min_value=0.0, value=float(params.tolerance.thickness_mm), step=0.5
+        # Tolerance is frozen, so build a new one from the inputs
+        tolerance = Tolerance(
+            length_mm=st.number_input(
+                "Tolerance length (mm)", min_value=0.0, value=float(params.tolerance.length_mm), step=0.5
+            ),
+            width_mm=st.number_input(
+                "Tolerance width (mm)", min_value=0.0, value=float(params.tolerance.width_mm), step=0.5
+            ),
+            thickness_mm=st.number_input(
+                "Tolerance thickness (mm)", min_value=0.0, value=float(params.tolerance.thickness_mm), step=0.5
+            ),
         )
     with col3:
-        params.optimization_priority = st.selectbox(
+        optimization_priority = st.selectbox(
             "Optimization priority", ["efficiency", "cost", "speed"], index=["efficiency", "cost", "speed"].index(params.optimization_priority)
         )
-    st.session_state.parameters = params
+    edited = CuttingParameters(
+        kerf_mm=kerf_mm,
+        min_offcut_keep_mm=min_offcut_keep_mm,
+        tolerance=tolerance,
+        optimization_priority=optimization_priority,
+    )
+    if edited != params:
+        st.session_state.parameters = edited
+        save_state()
 
 
 def step_optimize() -> None:
@@ -278,8 +479,10 @@ def step_optimize() -> None:
 
     if st.button("Run optimization", type="primary"):
         with st.spinner("Optimizing cutting plan..."):
-            result = optimize_cutting_plan(inventory_items, part_requirements, st.session_state.parameters)
+            result = cached_optimize(inventory_items, part_requirements, st.session_state.parameters)
             st.session_state.result = result
+            st.session_state.result_key = result_key(result)
+            save_state()
             st.success("Optimization complete")
 
 
@@ -289,42 +492,61 @@ def step_results() -> None:
     if result is None:
         st.info("Run an optimization to view results.")
         return
+    if st.session_state.result_key is None:
+        st.session_state.result_key = result_key(result)
+    key: str = st.session_state.result_key
 
-    m1, m2, m3 = st.columns(3)
-    m1.metric("Utilization %", f"{result.utilization_percent:.2f}")
-    m2.metric("Waste %", f"{result.waste_percent:.2f}")
-    m3.metric("Total cuts", f"{result.total_cuts}")
+    st.markdown(metrics_html(result), unsafe_allow_html=True)
 
     st.subheader("Per-stick plans")
-    stick_labels = [f"{s.inventory_name} #{s.stick_index}" for s in result.stick_plans]
-    if not stick_labels:
+    sticks = result.stick_plans
+    if not sticks:
         st.info("No sticks were used.")
     else:
-        selected = st.selectbox("Stick", options=list(range(len(stick_labels))), format_func=lambda i: stick_labels[i])
-        stick = result.stick_plans[selected]
-        svg = render_stick_svg(stick, px_per_mm=0.25)
-        st.components.v1.html(svg, height=int(stick.dims_mm.width_mm * 0.25) + 50, scrolling=True)
+        # Large results are paged so only one page of options is sent
+        start, stop = 0, len(sticks)
+        if len(sticks) > MAX_STICK_OPTIONS:
+            pages = (len(sticks) + STICK_PAGE_SIZE - 1) // STICK_PAGE_SIZE
+            page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, value=1, step=1)
+            start = (int(page) - 1) * STICK_PAGE_SIZE
+            stop = min(start + STICK_PAGE_SIZE, len(sticks))
+        stick_labels = {i: f"{sticks[i].inventory_name} #{sticks[i].stick_index}" for i in range(start, stop)}
+        selected = st.selectbox("Stick", options=list(stick_labels), format_func=stick_labels.__getitem__)
+        stick = sticks[selected]
+        svg = cached_stick_svg(key, selected, 0.25, result)
+        components.html(svg, height=int(stick.dims_mm.width_mm * 0.25) + 50, scrolling=True)
 
     st.subheader("Composite view")
-    composite = render_composite_svg(result.stick_plans, px_per_mm=0.2)
-    st.components.v1.html(composite, height=400, scrolling=True)
+    if st.checkbox("Show composite view", value=False):
+        composite = cached_composite_svg(key, 0.2, result)
+        components.html(composite, height=400, scrolling=True)
 
     st.subheader("Summary by part")
-    part_rows = []
-    for key, summary in result.summary_by_part.items():
-        part_rows.append({"part_key": key, **summary})
-    st.table(part_rows)
+    st.dataframe(cached_part_summary(key, result), use_container_width=True, hide_index=True)
 
     st.subheader("Exports")
-    csv_data = export_csv(result)
+    # Exports are only built once asked for, then stay available for this result
+    if st.button("Prepare exports"):
+        st.session_state.exports_key = key
+    if st.session_state.get("exports_key") != key:
+        return
+    csv_data = cached_csv_export(key, result)
     st.download_button("Download CSV", data=csv_data, file_name="cutting_plan.csv", mime="text/csv")
     try:
-        pdf_bytes = export_pdf(result)
+        pdf_bytes = cached_pdf_export(key, result)
         st.download_button("Download PDF", data=pdf_bytes, file_name="cutting_plan.pdf", mime="application/pdf")
     except Exception as e:
         st.warning(f"PDF generation failed: {e}")
 
 
+STEPS = {
+    "Inputs": step_inputs,
+    "Parameters": step_parameters,
+    "Optimize": step_optimize,
+    "Results": step_results,
+}
+
+
 def main() -> None:
     init_state()
     st.title("🪵 Greenstrand Packaging — Cutting Plan Optimizer")
@@ -332,19 +554,20 @@ def main() -> None:
 
     step = st.sidebar.radio(
         "Workflow",
-        options=["Inputs", "Parameters", "Optimize", "Results"],
+        options=list(STEPS),
         captions=["Upload or add data", "Kerf, tolerances, etc.", "Run optimizer", "Inspect and export"],
         index=0,
     )
+    st.sidebar.text_input(
+        "Project", key="project", on_change=switch_project, placeholder="Name a project to save your work"
+    )
+    if st.sidebar.button("💾 Save State", use_container_width=True):
+        if save_state():
+            st.sidebar.success("State saved")
+        else:
+            st.sidebar.warning("Enter a project name to save state")
 
-    if step == "Inputs":
-        step_inputs()
-    elif step == "Parameters":
-        step_parameters()
-    elif step == "Optimize":
-        step_optimize()
-    elif step == "Results":
-        step_results()
+    STEPS[step]()
 
 
 if __name__ == "__main__":